@@ -21,6 +21,10 @@ class OrderManagementSystem:
             raise ValueError("Type must be 'market', 'limit', or 'stop'")
         if order.type in ("limit", "stop") and order.price is None:
             raise ValueError("Limit/stop orders require a price")
+        # check routing up front, so a mismatched order is never recorded as accepted
+        engine_symbol = getattr(self.matching_engine, "symbol", order.symbol)
+        if order.symbol != engine_symbol:
+            raise ValueError(f"Order symbol {order.symbol} does not match matching engine symbol {engine_symbol}")
 
         now = datetime.now(timezone.utc)
         order.timestamp = order.timestamp or now
@@ -2,10 +2,12 @@ from dataclasses import dataclass
 from datetime import datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class Order:
     """
     Represents a single trade instruction.
+    Slotted: orders are created per signal and rest in the book in bulk,
+    so they carry no per-instance __dict__.
     """
     id: str                     # unique identifier (e.g. UUID or string)
     symbol: str                 # ticker or asset code (e.g. "AAPL", "EURUSD=X")
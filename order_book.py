@@ -1,180 +1,342 @@
+from collections import deque
 from datetime import datetime, timezone
-from typing import List, Dict
+from typing import Deque, List, Dict, NamedTuple, Optional, Union
+from sortedcontainers import SortedDict
 from order import Order
 
 
+class ExecutionReport(NamedTuple):
+    """
+    One fill on one side of a trade.
+    """
+    order_id: str
+    symbol: str
+    side: str                   # "buy" or "sell"
+    filled_qty: int
+    price: float
+    timestamp: datetime
+    status: str                 # "filled" or "partial_fill"
+
+    def to_dict(self) -> Dict:
+        """
+        Return the report as a plain dict keyed by field name.
+        """
+        return self._asdict()
+
+
 class LimitOrderBook:
     """
-    A simple price–time priority limit order book.
+    A simple price–time priority limit order book for a single symbol.
+
+    Price levels are keyed by the exact order price. Given a tick_size,
+    they are keyed by whole ticks instead, and limit prices that are off
+    that grid are rejected with a ValueError.
+
+    With detailed_reports=True (the default) every fill yields two reports,
+    one for the incoming order and one for the resting order it hit.
+    With detailed_reports=False only the incoming order's reports are
+    returned, which halves report volume for callers that just track
+    their own fills.
     """
 
-    def __init__(self, symbol: str):
+    def __init__(self, symbol: str, tick_size: Optional[float] = None, detailed_reports: bool = True):
         self.symbol = symbol
-        # bids: list of resting buy orders, highest price first
-        self.bids: List[Order] = []
-        # asks: list of resting sell orders, lowest price first
-        self.asks: List[Order] = []
+        self.tick_size = tick_size
+        self.detailed_reports = detailed_reports
+        # bid_levels: level key -> FIFO queue of resting buy orders (best = highest key)
+        self.bid_levels: SortedDict = SortedDict()
+        # ask_levels: level key -> FIFO queue of resting sell orders (best = lowest key)
+        self.ask_levels: SortedDict = SortedDict()
+        # cached level keys of the top of book, kept in step with the level maps
+        self._best_bid: Optional[Union[int, float]] = None
+        self._best_ask: Optional[Union[int, float]] = None
+        # handler per order type, so add_order dispatches with one lookup
+        self._handlers = {
+            "market": self._handle_market,
+            "limit":  self._handle_limit,
+            "stop":   self._handle_limit,
+        }
 
-    def add_order(self, order: Order) -> List[Dict]:
+    def best_bid(self) -> Optional[float]:
         """
-        Handle a new incoming order (market, limit, or stop).
-        Returns a list of execution report dicts.
+        Highest resting bid price, or None if there are no bids.
         """
-        reports = []
+        if self._best_bid is None:
+            return None
+        return self.bid_levels[self._best_bid][0].price
 
-        if order.type == "market":
-            reports += self._execute_market(order)
+    def best_ask(self) -> Optional[float]:
+        """
+        Lowest resting ask price, or None if there are no asks.
+        """
+        if self._best_ask is None:
+            return None
+        return self.ask_levels[self._best_ask][0].price
 
-        elif order.type == "limit":
-            # try to match immediately
-            reports += self._match_limit(order)
-            # if there's leftover quantity, add to book
-            if order.quantity > 0:
-                self._insert_resting(order)
+    def best_bid_qty(self) -> int:
+        """
+        Total resting quantity at the best bid (0 if there are no bids).
+        """
+        if self._best_bid is None:
+            return 0
+        return sum(o.quantity for o in self.bid_levels[self._best_bid])
 
-        else:
-            # for now, treat stop orders as plain limit orders 
-            # once triggered by strategy logic
-            reports += self._match_limit(order)
-            if order.quantity > 0:
-                self._insert_resting(order)
+    def best_ask_qty(self) -> int:
+        """
+        Total resting quantity at the best ask (0 if there are no asks).
+        """
+        if self._best_ask is None:
+            return 0
+        return sum(o.quantity for o in self.ask_levels[self._best_ask])
 
+    def _level_key(self, price: float) -> Union[int, float]:
+        """
+        Key of the price level for price: the price itself, or its whole
+        number of ticks when the book has a tick size. Off-grid prices are
+        rejected rather than rounded, since rounding could let an order
+        trade through its limit or merge distinct prices into one level.
+        """
+        if self.tick_size is None:
+            return price
+        ticks = round(price / self.tick_size)
+        if abs(ticks * self.tick_size - price) > 1e-9 * max(1.0, abs(price)):
+            raise ValueError(f"Price {price} is not a multiple of tick size {self.tick_size}")
+        return ticks
+
+    def _refresh_best(self):
+        """
+        Re-read the cached best prices after a level has been removed.
+        """
+        self._best_bid = self.bid_levels.peekitem(-1)[0] if self.bid_levels else None
+        self._best_ask = self.ask_levels.peekitem(0)[0] if self.ask_levels else None
+
+    def add_order(self, order: Order) -> List[ExecutionReport]:
+        """
+        Handle a new incoming order (market, limit, or stop).
+        Returns a list of ExecutionReport objects (use to_dict() for dicts).
+        All fills produced by one incoming order share a single timestamp.
+        Raises ValueError for an order on a different symbol, so every
+        report can carry the book's symbol.
+        """
+        if order.symbol != self.symbol:
+            raise ValueError(f"Order symbol {order.symbol} does not match book symbol {self.symbol}")
+        timestamp = datetime.now(timezone.utc)
+        # for now, stop orders (and anything unrecognised) are treated as
+        # plain limit orders once triggered by strategy logic
+        handler = self._handlers.get(order.type, self._handle_limit)
+        return handler(order, timestamp)
+
+    def _handle_limit(self, order: Order, timestamp: datetime) -> List[ExecutionReport]:
+        """
+        Match a limit order immediately and rest any leftover quantity.
+        The limit's level key is computed once and shared by both steps.
+        """
+        limit = self._level_key(order.price)
+        if order.side == "buy":
+            reports = self._match_limit_buy(order, limit, timestamp)
+        else:
+            reports = self._match_limit_sell(order, limit, timestamp)
+        if order.quantity > 0:
+            if reports:
+                self._rest_at_top(order, limit)
+            else:
+                self._insert_resting(order, limit)
         return reports
 
-    def _match_limit(self, order: Order) -> List[Dict]:
+    def _handle_market(self, order: Order, timestamp: datetime) -> List[ExecutionReport]:
         """
-        Match a limit order against the book.
-        Fill as much as possible at prices satisfying the limit.
+        Route a market order to the sweep for its side.
+        """
+        if order.side == "buy":
+            return self._execute_market_buy(order, timestamp)
+        return self._execute_market_sell(order, timestamp)
+
+    def _match_limit_buy(self, order: Order, limit: Union[int, float], timestamp: datetime) -> List[ExecutionReport]:
+        """
+        Match a buy limit order against asks priced at or below limit (a level key).
         """
         reports = []
-        # choose opposite side
-        opposite = self.asks if order.side == "buy" else self.bids
-
-        # continue matching while we still have quantity
-        # and there is a resting order that satisfies the price
-        while order.quantity > 0 and opposite:
-            best = opposite[0]
-            # buy order matches if best ask <= order.price
-            if order.side == "buy" and best.price > order.price:
+        levels = self.ask_levels
+
+        while order.quantity > 0 and levels:
+            price, queue = levels.peekitem(0)
+            if price > limit:
                 break
-            # sell order matches if best bid >= order.price
-            if order.side == "sell" and best.price < order.price:
+            self._fill_level(order, queue, timestamp, reports)
+            # remove the level once it empties
+            if not queue:
+                del levels[price]
+                self._refresh_best()
+
+        return reports
+
+    def _match_limit_sell(self, order: Order, limit: Union[int, float], timestamp: datetime) -> List[ExecutionReport]:
+        """
+        Match a sell limit order against bids priced at or above limit (a level key).
+        """
+        reports = []
+        levels = self.bid_levels
+
+        while order.quantity > 0 and levels:
+            price, queue = levels.peekitem(-1)
+            if price < limit:
                 break
+            self._fill_level(order, queue, timestamp, reports)
+            # remove the level once it empties
+            if not queue:
+                del levels[price]
+                self._refresh_best()
+
+        return reports
+
+    def _fill_level(self, order: Order, queue: Deque[Order], timestamp: datetime,
+                    reports: List[ExecutionReport]):
+        """
+        Fill a limit order against one price level in FIFO order,
+        appending a report for each side of every fill.
+        """
+        # bind hot attributes and callables to locals; the incoming
+        # quantity is tracked locally and written back once at the end
+        # add_order only admits orders on self.symbol, so reports use it as-is
+        oid, oside, symbol = order.id, order.side, self.symbol
+        oqty = order.quantity
+        append = reports.append
+        popleft = queue.popleft
+        new_report = ExecutionReport
+        detailed = self.detailed_reports
+
+        while oqty > 0 and queue:
+            best = queue[0]
+            bqty = best.quantity
 
             # a fill occurs: trade quantity = min(incoming, resting)
-            fill_qty   = min(order.quantity, best.quantity)
+            fill_qty    = oqty if oqty < bqty else bqty
             trade_price = best.price
-            timestamp   = datetime.now(timezone.utc)
-
-            # build execution report for the incoming order
-            reports.append({
-                "order_id":      order.id,
-                "symbol":        order.symbol,
-                "side":          order.side,
-                "filled_qty":    fill_qty,
-                "price":         trade_price,
-                "timestamp":     timestamp,
-                "status":        "filled" if (order.quantity - fill_qty) == 0 else "partial_fill"
-            })
-
-            # also build report for the resting order
-            reports.append({
-                "order_id":      best.id,
-                "symbol":        best.symbol,
-                "side":          best.side,
-                "filled_qty":    fill_qty,
-                "price":         trade_price,
-                "timestamp":     timestamp,
-                "status":        "filled" if (best.quantity - fill_qty) == 0 else "partial_fill"
-            })
 
             # decrement quantities
-            order.quantity -= fill_qty
-            best.quantity  -= fill_qty
+            oqty -= fill_qty
+            bqty -= fill_qty
+            best.quantity = bqty
+
+            # build execution reports for the incoming and the resting order
+            append(new_report(
+                oid, symbol, oside, fill_qty, trade_price, timestamp,
+                "filled" if oqty == 0 else "partial_fill"
+            ))
+            if detailed:
+                append(new_report(
+                    best.id, symbol, best.side, fill_qty, trade_price, timestamp,
+                    "filled" if bqty == 0 else "partial_fill"
+                ))
 
             # remove resting order if fully filled
-            if best.quantity == 0:
-                opposite.pop(0)
+            if bqty == 0:
+                popleft()
+
+        order.quantity = oqty
+
+    def _execute_market_buy(self, order: Order, timestamp: datetime) -> List[ExecutionReport]:
+        """
+        Fill a buy market order against the full depth of the asks.
+        """
+        reports = []
+        levels = self.ask_levels
+
+        while order.quantity > 0 and levels:
+            price, queue = levels.peekitem(0)
+            self._sweep_level(order, queue, len(levels) == 1, timestamp, reports)
+            if not queue:
+                del levels[price]
+                self._refresh_best()
 
         return reports
 
-    def _execute_market(self, order: Order) -> List[Dict]:
+    def _execute_market_sell(self, order: Order, timestamp: datetime) -> List[ExecutionReport]:
         """
-        Fill a market order against the full depth of the book.
+        Fill a sell market order against the full depth of the bids.
         """
         reports = []
-        # opposite side = asks if buy; bids if sell
-        opposite = self.asks if order.side == "buy" else self.bids
+        levels = self.bid_levels
+
+        while order.quantity > 0 and levels:
+            price, queue = levels.peekitem(-1)
+            self._sweep_level(order, queue, len(levels) == 1, timestamp, reports)
+            if not queue:
+                del levels[price]
+                self._refresh_best()
 
-        while order.quantity > 0 and opposite:
-            best = opposite[0]
-            fill_qty    = min(order.quantity, best.quantity)
+        return reports
+
+    def _sweep_level(self, order: Order, queue: Deque[Order], last_level: bool,
+                     timestamp: datetime, reports: List[ExecutionReport]):
+        """
+        Fill a market order against one price level in FIFO order.
+        last_level tells whether this is the only level left on the side.
+        """
+        # add_order only admits orders on self.symbol, so reports use it as-is
+        oid, oside, symbol = order.id, order.side, self.symbol
+        oqty = order.quantity
+        append = reports.append
+        popleft = queue.popleft
+        new_report = ExecutionReport
+        detailed = self.detailed_reports
+
+        while oqty > 0 and queue:
+            best = queue[0]
+            bqty = best.quantity
+            fill_qty    = oqty if oqty < bqty else bqty
             trade_price = best.price
-            timestamp   = datetime.now(timezone.utc)
 
             # Update quantities first
-            order.quantity -= fill_qty
-            best.quantity  -= fill_qty
+            oqty -= fill_qty
+            bqty -= fill_qty
+            best.quantity = bqty
 
             # Market order status: "filled" if order quantity becomes 0 OR if this consumes the last resting order
-            market_status = "filled" if (order.quantity == 0 or (best.quantity == 0 and len(opposite) == 1)) else "partial_fill"
-            
-            reports.append({
-                "order_id":   order.id,
-                "symbol":     order.symbol,
-                "side":       order.side,
-                "filled_qty": fill_qty,
-                "price":      trade_price,
-                "timestamp":  timestamp,
-                "status":     market_status
-            })
-
-            reports.append({
-                "order_id":   best.id,
-                "symbol":     best.symbol,
-                "side":       best.side,
-                "filled_qty": fill_qty,
-                "price":      trade_price,
-                "timestamp":  timestamp,
-                "status":     "filled" if best.quantity == 0 else "partial_fill"
-            })
-
-            if best.quantity == 0:
-                opposite.pop(0)
+            last_resting = bqty == 0 and len(queue) == 1 and last_level
+            market_status = "filled" if (oqty == 0 or last_resting) else "partial_fill"
 
-        return reports
+            append(new_report(
+                oid, symbol, oside, fill_qty, trade_price, timestamp,
+                market_status
+            ))
+            if detailed:
+                append(new_report(
+                    best.id, symbol, best.side, fill_qty, trade_price, timestamp,
+                    "filled" if bqty == 0 else "partial_fill"
+                ))
+
+            if bqty == 0:
+                popleft()
+
+        order.quantity = oqty
+
+    def _rest_at_top(self, order: Order, key: Union[int, float]):
+        """
+        Rest the remainder of a limit order that has just traded.
+        Having crossed the spread, it is priced better than every resting
+        order on its own side, so it opens a new best level directly.
+        """
+        if order.side == "buy":
+            self.bid_levels[key] = deque((order,))
+            self._best_bid = key
+        else:
+            self.ask_levels[key] = deque((order,))
+            self._best_ask = key
+
+    def _insert_resting(self, order: Order, key: Union[int, float]):
+        """
+        Place a remainder limit order at the back of its price level,
+        which preserves time priority among orders at the same price.
+        """
+        if order.side == "buy":
+            levels = self.bid_levels
+            if self._best_bid is None or key > self._best_bid:
+                self._best_bid = key
+        else:
+            levels = self.ask_levels
+            if self._best_ask is None or key < self._best_ask:
+                self._best_ask = key
 
-    def _insert_resting(self, order: Order):
-        """
-        Place a remainder limit order into bids or asks,
-        maintaining sorted order with time priority.
-        """
-        book = self.bids if order.side == "buy" else self.asks
-
-        # find insertion index - orders with BETTER prices come first,
-        # orders with SAME or WORSE prices come after (time priority for same price)
-        idx = 0
-        while idx < len(book):
-            if order.side == "buy":
-                # For bids: higher prices come first, same prices maintain time order
-                if book[idx].price > order.price:
-                    idx += 1
-                else:
-                    # Found a price <= our price, but we need to go past all orders with same price
-                    # to maintain time priority (FIFO)
-                    while idx < len(book) and book[idx].price == order.price:
-                        idx += 1
-                    break
-            else:  # sell side
-                # For asks: lower prices come first, same prices maintain time order
-                if book[idx].price < order.price:
-                    idx += 1
-                else:
-                    # Found a price >= our price, but we need to go past all orders with same price
-                    # to maintain time priority (FIFO)
-                    while idx < len(book) and book[idx].price == order.price:
-                        idx += 1
-                    break
-
-        # insert at idx
-        book.insert(idx, order)  
\ No newline at end of file
+        queue: Deque[Order] = levels.setdefault(key, deque())
+        queue.append(order)
@@ -1,6 +1,6 @@
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Tuple
+from typing import Dict, Tuple
 import uuid
 from datetime import datetime, timezone
 
@@ -15,7 +15,11 @@ from order_book import LimitOrderBook
 from position_tracker import PositionTracker
 
 
-def run_backtest(history1: pd.DataFrame, history2: pd.DataFrame, risk_params: Dict, symbol1: str, symbol2: str) -> Tuple[pd.DataFrame, List[Dict], Dict]:
+# Column order of the trade records; trades are returned as a DataFrame with these columns
+TRADE_COLUMNS = ["timestamp", "symbol", "side", "quantity", "price", "signal", "spread", "beta", "transaction_cost", "leg"]
+
+
+def run_backtest(history1: pd.DataFrame, history2: pd.DataFrame, risk_params: Dict, symbol1: str, symbol2: str) -> Tuple[pd.DataFrame, pd.DataFrame, Dict]:
     """
     Cross-Asset Arbitrage Strategy Backtest
     
@@ -34,7 +38,7 @@ def run_backtest(history1: pd.DataFrame, history2: pd.DataFrame, risk_params: Di
         symbol2: str (second asset symbol)
         
     Returns:
-        Tuple[signals_df, trades_list, metrics_dict]
+        Tuple[signals_df, trades_df, metrics_dict]
     """
     
     # Extract parameters
@@ -125,8 +129,9 @@ def run_backtest(history1: pd.DataFrame, history2: pd.DataFrame, risk_params: Di
     for idx, row in df.iterrows():
         current_signal = row['signal']
         timestamp = row['timestamp']
-        price1 = row['p1']
-        price2 = row['p2']
+        # prices may be float32; account in Python floats
+        price1 = float(row['p1'])
+        price2 = float(row['p2'])
         
         # Skip if no signal change or if we have NaN values
         if (current_signal == previous_signal or 
@@ -235,19 +240,19 @@ def run_backtest(history1: pd.DataFrame, history2: pd.DataFrame, risk_params: Di
                 else:
                     position2 -= quantity
             
-            # Record trade
-            trade_record = {
-                "timestamp": timestamp,
-                "symbol": symbol,
-                "side": side,
-                "quantity": quantity,
-                "price": price,
-                "signal": current_signal,
-                "spread": row['spread'],
-                "beta": row['beta'],
-                "transaction_cost": trade_cost,
-                "leg": "asset1" if symbol == symbol1 else "asset2"
-            }
+            # Record trade (fields in TRADE_COLUMNS order)
+            trade_record = (
+                timestamp,
+                symbol,
+                side,
+                quantity,
+                price,
+                current_signal,
+                row['spread'],
+                row['beta'],
+                trade_cost,
+                "asset1" if symbol == symbol1 else "asset2"
+            )
             trades_list.append(trade_record)
         
         previous_signal = current_signal
@@ -302,10 +307,13 @@ def run_backtest(history1: pd.DataFrame, history2: pd.DataFrame, risk_params: Di
             'num_pairs_traded': num_pairs
         }
     
-    return df, trades_list, metrics_dict
+    # build the trade table once from the record tuples (no per-row dicts)
+    trades_df = pd.DataFrame.from_records(trades_list, columns=TRADE_COLUMNS)
+    
+    return df, trades_df, metrics_dict
 
 
-def run_backtest_single_interface(combined_history: pd.DataFrame, risk_params: Dict, symbol_pair: str) -> Tuple[pd.DataFrame, List[Dict], Dict]:
+def run_backtest_single_interface(combined_history: pd.DataFrame, risk_params: Dict, symbol_pair: str) -> Tuple[pd.DataFrame, pd.DataFrame, Dict]:
     """
     Wrapper function for single DataFrame interface compatibility with Streamlit
     
@@ -415,9 +423,9 @@ if __name__ == "__main__":
         print(f"Final Cash: ${metrics['final_cash']:,.2f}")
         print(f"Transaction Costs: ${metrics['transaction_costs']:,.2f}")
         
-        if trades:
+        if not trades.empty:
             print(f"\nFirst few trades:")
-            for i, trade in enumerate(trades[:6]):
+            for i, trade in enumerate(trades.head(6).to_dict('records')):
                 print(f"  {i+1}: {trade}")
         
         # Show signal distribution
@@ -1,6 +1,6 @@
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Tuple
+from typing import Dict, Tuple
 import uuid
 from datetime import datetime, timezone
 
@@ -15,7 +15,11 @@ from order_book import LimitOrderBook
 from position_tracker import PositionTracker
 
 
-def run_backtest(history: pd.DataFrame, risk_params: Dict, symbol: str) -> Tuple[pd.DataFrame, List[Dict], Dict]:
+# Column order of the trade records; trades are returned as a DataFrame with these columns
+TRADE_COLUMNS = ["timestamp", "symbol", "side", "quantity", "price", "signal"]
+
+
+def run_backtest(history: pd.DataFrame, risk_params: Dict, symbol: str) -> Tuple[pd.DataFrame, pd.DataFrame, Dict]:
     """
     Trend-Following Strategy Backtest
     
@@ -32,7 +36,7 @@ def run_backtest(history: pd.DataFrame, risk_params: Dict, symbol: str) -> Tuple
         symbol: str (asset symbol)
         
     Returns:
-        Tuple[signals_df, trades_list, metrics_dict]
+        Tuple[signals_df, trades_df, metrics_dict]
     """
     
     # Extract parameters
@@ -97,7 +101,7 @@ def run_backtest(history: pd.DataFrame, risk_params: Dict, symbol: str) -> Tuple
     
     for idx, row in signals_df.iterrows():
         current_signal = row['signal']
-        current_price = row['last_price']
+        current_price = float(row['last_price'])  # prices may be float32; account in Python floats
         timestamp = row['timestamp']
         
         # Skip if signal is the same as previous or if we have NaN values
@@ -166,15 +170,15 @@ def run_backtest(history: pd.DataFrame, risk_params: Dict, symbol: str) -> Tuple
             else:  # sell
                 current_position -= quantity
             
-            # Record trade
-            trade_record = {
-                "timestamp": timestamp,
-                "symbol": symbol,
-                "side": side,
-                "quantity": quantity,
-                "price": current_price,
-                "signal": current_signal
-            }
+            # Record trade (fields in TRADE_COLUMNS order)
+            trade_record = (
+                timestamp,
+                symbol,
+                side,
+                quantity,
+                current_price,
+                current_signal
+            )
             trades_list.append(trade_record)
         
         previous_signal = current_signal
@@ -222,7 +226,10 @@ def run_backtest(history: pd.DataFrame, risk_params: Dict, symbol: str) -> Tuple
             'final_cash': final_value
         }
     
-    return signals_df, trades_list, metrics_dict
+    # build the trade table once from the record tuples (no per-row dicts)
+    trades_df = pd.DataFrame.from_records(trades_list, columns=TRADE_COLUMNS)
+    
+    return signals_df, trades_df, metrics_dict
 
 
 if __name__ == "__main__":
@@ -256,7 +263,7 @@ if __name__ == "__main__":
     print(f"Number of Trades: {metrics['num_trades']}")
     print(f"Final Cash: ${metrics['final_cash']:,.2f}")
     
-    if trades:
+    if not trades.empty:
         print(f"\nFirst few trades:")
-        for i, trade in enumerate(trades[:3]):
+        for i, trade in enumerate(trades.head(3).to_dict('records')):
             print(f"  {i+1}: {trade}")
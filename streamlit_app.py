@@ -6,20 +6,169 @@ Streamlit App for Trend Following Strategy Backtesting
 import streamlit as st
 import pandas as pd
 import numpy as np
-import plotly.graph_objects as go
-import plotly.express as px
-from plotly.subplots import make_subplots
 from datetime import datetime, timedelta
 import sys
 import os
+import time
 
 # Add the parent directory to the path for imports
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from market_data_loader import MarketDataLoader
-from strategies.trend_following import run_backtest as tf_run_backtest
-from strategies.mean_reversion import run_backtest as mr_run_backtest
-from strategies.arbitrage import run_backtest as arb_run_backtest
+
+# Plotly and the strategy modules are imported where they are used, so a
+# fresh script run only pays for them once a backtest is actually requested
+
+
+# OHLC columns stored as float32: ample precision for prices at half the memory
+PRICE_COLUMNS = ('open', 'high', 'low', 'last_price')
+
+
+def _downcast_prices(df: pd.DataFrame) -> pd.DataFrame:
+    """Downcast the OHLC price columns of a prepared history frame to float32"""
+    for col in PRICE_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].astype(np.float32, copy=False)
+    return df
+
+
+# Upper bound on points per line trace; a chart is only ~1500 px wide anyway
+MAX_PLOT_POINTS = 5000
+
+
+def _downsample(df: pd.DataFrame, n_max: int = MAX_PLOT_POINTS, keep=None) -> pd.DataFrame:
+    """
+    Stride-decimate df to roughly n_max rows for plotting.
+    Rows flagged in the boolean array `keep` (e.g. signal bars) are always retained.
+    """
+    step = len(df) // n_max
+    if step <= 1:
+        return df
+    mask = np.zeros(len(df), dtype=bool)
+    mask[::step] = True
+    if keep is not None:
+        mask |= keep
+    return df[mask]
+
+
+def _plot_times(df: pd.DataFrame) -> np.ndarray:
+    """Timestamps of df as datetime64[ms], which Plotly serializes far more compactly than Timestamps"""
+    return df['timestamp'].values.astype('datetime64[ms]')
+
+
+# On-disk history cache, so restarts and fresh workers skip the Yahoo round trip.
+# Files expire after a day (Yahoo back-adjusts history after dividends and splits)
+# and expired ones are deleted whenever a new file is written
+HISTORY_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "algo-trading")
+HISTORY_CACHE_MAX_AGE = 24 * 3600  # seconds
+
+
+def _prune_history_cache():
+    """Delete cached history files (and leftover temp files) past HISTORY_CACHE_MAX_AGE"""
+    cutoff = time.time() - HISTORY_CACHE_MAX_AGE
+    try:
+        entries = list(os.scandir(HISTORY_CACHE_DIR))
+    except OSError as e:
+        print(f"Error listing cached history in {HISTORY_CACHE_DIR}: {e}")
+        return
+    for entry in entries:
+        if not entry.name.endswith((".parquet", ".tmp")):
+            continue
+        try:
+            if entry.stat().st_mtime < cutoff:
+                os.remove(entry.path)
+        except FileNotFoundError:
+            pass  # removed by another worker in the meantime
+        except OSError as e:
+            print(f"Error removing cached history {entry.path}: {e}")
+
+
+class _NoHistory(Exception):
+    """Raised by _fetch_history when a download returns no rows"""
+
+
+def _load_history(symbol: str, start: str, end: str, interval: str) -> pd.DataFrame:
+    """Price history for one symbol, or an empty frame if none could be fetched"""
+    try:
+        return _fetch_history(symbol, start, end, interval)
+    except _NoHistory:
+        return pd.DataFrame()
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _fetch_history(symbol: str, start: str, end: str, interval: str) -> pd.DataFrame:
+    """
+    Fetch price history for one symbol, cached across reruns for an hour
+    and persisted as parquet under HISTORY_CACHE_DIR for up to a day.
+    Raises _NoHistory when nothing comes back, since st.cache_data does not
+    cache exceptions: a failed or throttled download is retried next time.
+    """
+    path = os.path.join(HISTORY_CACHE_DIR, f"{symbol}_{start}_{end}_{interval}.parquet")
+    if os.path.exists(path) and time.time() - os.path.getmtime(path) < HISTORY_CACHE_MAX_AGE:
+        try:
+            return pd.read_parquet(path)
+        except Exception as e:
+            print(f"Error reading cached history {path}, downloading again: {e}")
+    
+    # a fresh loader per fetch: its own in-memory dict would otherwise outlive
+    # the caches here and keep serving failed (empty) downloads
+    loader = MarketDataLoader(interval=interval, period="max")
+    data = loader.get_history(symbol, start=start, end=end)
+    if not data.empty:
+        try:
+            os.makedirs(HISTORY_CACHE_DIR, exist_ok=True)
+            # write then rename, so a concurrent reader never sees a partial file
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            data.to_parquet(tmp_path)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            # the disk cache is best effort; the fetched data is still returned
+            print(f"Error writing cached history {path}: {e}")
+        else:
+            # keys embed the date range, so expired files are never reread: drop them
+            _prune_history_cache()
+    else:
+        raise _NoHistory(f"No data returned for {symbol} from {start} to {end}")
+    return data
+
+
+# Entries kept per result cache (backtests, trade tables, figures), so
+# parameter exploration cannot grow memory without bound
+RESULT_CACHE_ENTRIES = 16
+
+
+# Backtests are memoized on the data content and a hashable params tuple,
+# so reruns with unchanged inputs skip the simulation entirely
+@st.cache_data(max_entries=RESULT_CACHE_ENTRIES, show_spinner=False)
+def _run_tf(data: pd.DataFrame, params_tuple: tuple, symbol: str):
+    """Cached trend following backtest"""
+    from strategies.trend_following import run_backtest as tf_run_backtest
+    return tf_run_backtest(data, dict(params_tuple), symbol)
+
+
+@st.cache_data(max_entries=RESULT_CACHE_ENTRIES, show_spinner=False)
+def _run_mr(data: pd.DataFrame, params_tuple: tuple, symbol: str):
+    """Cached mean reversion backtest"""
+    from strategies.mean_reversion import run_backtest as mr_run_backtest
+    return mr_run_backtest(data, dict(params_tuple), symbol)
+
+
+@st.cache_data(max_entries=RESULT_CACHE_ENTRIES, show_spinner=False)
+def _run_arb(data1: pd.DataFrame, data2: pd.DataFrame, params_tuple: tuple, symbol1: str, symbol2: str):
+    """Cached cross-asset arbitrage backtest"""
+    from strategies.arbitrage import run_backtest as arb_run_backtest
+    return arb_run_backtest(data1, data2, dict(params_tuple), symbol1, symbol2)
+
+
+@st.cache_data(max_entries=RESULT_CACHE_ENTRIES, show_spinner=False)
+def _trades_dataframe(trades) -> pd.DataFrame:
+    """Trades as a display-ready DataFrame, cached on the trades' content"""
+    # strategies return a DataFrame already; a list of trade dicts is still accepted
+    trades_df = trades if isinstance(trades, pd.DataFrame) else pd.DataFrame.from_records(trades)
+    return trades_df.assign(
+        timestamp=pd.to_datetime(trades_df['timestamp']),
+        price=trades_df['price'].round(2)
+    )
 
 
 def main():
@@ -285,22 +434,16 @@ def main():
         # Show loading spinner
         with st.spinner(f"📡 Loading {asset_name} data and running {strategy_type} backtest..."):
             try:
-                # Load data
-                loader = MarketDataLoader(interval=interval, period="max")
+                # Load data (cached per symbol, date range and interval)
+                start_str = start_date.strftime("%Y-%m-%d")
+                end_str = end_date.strftime("%Y-%m-%d")
                 
                 if strategy_type == "Cross-Asset Arbitrage":
-                    # Load data for both assets
-                    data1 = loader.get_history(
-                        symbol1, 
-                        start=start_date.strftime("%Y-%m-%d"),
-                        end=end_date.strftime("%Y-%m-%d")
-                    )
-                    
-                    data2 = loader.get_history(
-                        symbol2, 
-                        start=start_date.strftime("%Y-%m-%d"),
-                        end=end_date.strftime("%Y-%m-%d")
-                    )
+                    # Load the two legs one after the other: older yfinance releases
+                    # keep download results in module-global state, so concurrent
+                    # downloads can overwrite each other
+                    data1 = _load_history(symbol1, start_str, end_str, interval)
+                    data2 = _load_history(symbol2, start_str, end_str, interval)
                     
                     if data1.empty or data2.empty:
                         st.error(f"❌ No data found for one or both symbols ({symbol1}, {symbol2}). Please check the symbols and try again.")
@@ -312,30 +455,23 @@ def main():
                     data1_reset = data1_reset.rename(columns={'Date': 'timestamp'})
                     data2_reset = data2_reset.rename(columns={'Date': 'timestamp'})
                     
-                    # Flatten multi-level columns if needed
+                    # Flatten (Price, Ticker) columns; yfinance returns them even for a single ticker
                     if isinstance(data1_reset.columns, pd.MultiIndex):
                         data1_reset.columns = [col[0] if col[0] else 'timestamp' for col in data1_reset.columns]
                     if isinstance(data2_reset.columns, pd.MultiIndex):
                         data2_reset.columns = [col[0] if col[0] else 'timestamp' for col in data2_reset.columns]
                     
-                    # Create history DataFrames
-                    data1_history = pd.DataFrame({
-                        'timestamp': data1_reset['timestamp'],
-                        'last_price': data1_reset['last_price']
-                    })
+                    data1_reset = _downcast_prices(data1_reset)
+                    data2_reset = _downcast_prices(data2_reset)
                     
-                    data2_history = pd.DataFrame({
-                        'timestamp': data2_reset['timestamp'],
-                        'last_price': data2_reset['last_price']
-                    })
+                    # History frames are column selections of the prepared data; the
+                    # arbitrage backtest copies its inputs, so no extra copy is needed
+                    data1_history = data1_reset[['timestamp', 'last_price']]
+                    data2_history = data2_reset[['timestamp', 'last_price']]
                     
                 else:
                     # Single asset data loading
-                    data = loader.get_history(
-                        symbol, 
-                        start=start_date.strftime("%Y-%m-%d"),
-                        end=end_date.strftime("%Y-%m-%d")
-                    )
+                    data = _load_history(symbol, start_str, end_str, interval)
                     
                     if data.empty:
                         st.error(f"❌ No data found for symbol {symbol}. Please check the symbol and try again.")
@@ -345,25 +481,37 @@ def main():
                     data_reset = data.reset_index()
                     data_reset = data_reset.rename(columns={'Date': 'timestamp'})
                 
-                    # Flatten multi-level columns if needed
+                    # Flatten (Price, Ticker) columns; yfinance returns them even for a single ticker
                     if isinstance(data_reset.columns, pd.MultiIndex):
                         data_reset.columns = [col[0] if col[0] else 'timestamp' for col in data_reset.columns]
+                    
+                    data_reset = _downcast_prices(data_reset)
                 
                 # Run backtest based on strategy type
+                params_tuple = tuple(sorted(params.items()))
                 if strategy_type == "Trend Following":
-                    signals, trades, metrics = tf_run_backtest(data_reset, params, symbol)
-                    display_results(data_reset, signals, trades, metrics, symbol, asset_name, params, strategy_type)
+                    signals, trades, metrics = _run_tf(data_reset, params_tuple, symbol)
+                    results = (data_reset, signals, trades, metrics, symbol, asset_name, params, strategy_type)
                 elif strategy_type == "Mean Reversion":
-                    signals, trades, metrics = mr_run_backtest(data_reset, params, symbol)
-                    display_results(data_reset, signals, trades, metrics, symbol, asset_name, params, strategy_type)
+                    signals, trades, metrics = _run_mr(data_reset, params_tuple, symbol)
+                    results = (data_reset, signals, trades, metrics, symbol, asset_name, params, strategy_type)
                 else:  # Cross-Asset Arbitrage
-                    signals, trades, metrics = arb_run_backtest(data1_history, data2_history, params, symbol1, symbol2)
-                    display_arbitrage_results(data1_history, data2_history, signals, trades, metrics, symbol1, symbol2, asset_name, params)
+                    signals, trades, metrics = _run_arb(data1_history, data2_history, params_tuple, symbol1, symbol2)
+                    results = (data1_history, data2_history, signals, trades, metrics, symbol1, symbol2, asset_name, params)
+                
+                # Keep the results so later reruns can redraw them without loading or backtesting again
+                st.session_state['last_backtest'] = (strategy_type, results)
+                show_backtest(strategy_type, results)
                 
             except Exception as e:
                 st.error(f"❌ Error during backtesting: {str(e)}")
                 st.exception(e)
     
+    elif 'last_backtest' in st.session_state:
+        # Redraw the previous run; changed settings apply on the next Run click
+        st.caption("Showing the last backtest. Click **Run Backtest** to apply changed settings.")
+        show_backtest(*st.session_state['last_backtest'])
+    
     else:
         # Show instructions
         st.markdown("""
@@ -429,6 +577,14 @@ def main():
             st.markdown("- USO (Oil)")
 
 
+def show_backtest(strategy_type, results):
+    """Render a backtest result tuple with the display function for its strategy"""
+    if strategy_type == "Cross-Asset Arbitrage":
+        display_arbitrage_results(*results)
+    else:
+        display_results(*results)
+
+
 def display_results(data, signals, trades, metrics, symbol, asset_name, params, strategy_type):
     """Display backtest results"""
     
@@ -480,7 +636,8 @@ def display_results(data, signals, trades, metrics, symbol, asset_name, params,
     with col2:
         # Buy and hold comparison
         if len(data) > 0:
-            buy_hold_return = (data['last_price'].iloc[-1] - data['last_price'].iloc[0]) / data['last_price'].iloc[0]
+            prices = data['last_price'].to_numpy()
+            buy_hold_return = (prices[-1] - prices[0]) / prices[0]
             buy_hold_final = params['starting_cash'] * (1 + buy_hold_return)
             
             st.write("**Buy & Hold Comparison:**")
@@ -491,141 +648,16 @@ def display_results(data, signals, trades, metrics, symbol, asset_name, params,
     # Price chart with signals
     st.subheader(f"📈 Price Chart with {strategy_type} Signals")
     
-    fig = make_subplots(
-        rows=2, cols=1,
-        subplot_titles=(f'Price and {strategy_type} Indicators', 'Trading Signals'),
-        vertical_spacing=0.1,
-        row_heights=[0.7, 0.3]
-    )
-    
-    # Price
-    fig.add_trace(
-        go.Scatter(
-            x=signals['timestamp'],
-            y=signals['last_price'],
-            name='Price',
-            line=dict(color='black', width=1)
-        ),
-        row=1, col=1
-    )
-    
-    if strategy_type == "Trend Following":
-        # Moving averages
-        fig.add_trace(
-            go.Scatter(
-                x=signals['timestamp'],
-                y=signals['ma_short'],
-                name=f'MA{params["short_win"]}',
-                line=dict(color='blue', width=1)
-            ),
-            row=1, col=1
-        )
-        
-        fig.add_trace(
-            go.Scatter(
-                x=signals['timestamp'],
-                y=signals['ma_long'],
-                name=f'MA{params["long_win"]}',
-                line=dict(color='red', width=1)
-            ),
-            row=1, col=1
-        )
-    
-    else:  # Mean Reversion
-        # Bollinger Bands
-        fig.add_trace(
-            go.Scatter(
-                x=signals['timestamp'],
-                y=signals['upper'],
-                name='Upper Band',
-                line=dict(color='red', width=1, dash='dash'),
-                showlegend=True
-            ),
-            row=1, col=1
-        )
-        
-        fig.add_trace(
-            go.Scatter(
-                x=signals['timestamp'],
-                y=signals['lower'],
-                name='Lower Band',
-                line=dict(color='green', width=1, dash='dash'),
-                fill='tonexty',
-                fillcolor='rgba(0,100,80,0.1)',
-                showlegend=True
-            ),
-            row=1, col=1
-        )
-        
-        fig.add_trace(
-            go.Scatter(
-                x=signals['timestamp'],
-                y=signals['mid'],
-                name='Middle Line',
-                line=dict(color='blue', width=1)
-            ),
-            row=1, col=1
-        )
-    
-    # Buy/Sell signals
-    buy_signals = signals[signals['signal'] == 1]
-    sell_signals = signals[signals['signal'] == -1]
-    
-    if not buy_signals.empty:
-        fig.add_trace(
-            go.Scatter(
-                x=buy_signals['timestamp'],
-                y=buy_signals['last_price'],
-                mode='markers',
-                name='Buy Signal',
-                marker=dict(color='green', size=10, symbol='triangle-up')
-            ),
-            row=1, col=1
-        )
-    
-    if not sell_signals.empty:
-        fig.add_trace(
-            go.Scatter(
-                x=sell_signals['timestamp'],
-                y=sell_signals['last_price'],
-                mode='markers',
-                name='Sell Signal',
-                marker=dict(color='red', size=10, symbol='triangle-down')
-            ),
-            row=1, col=1
-        )
-    
-    # Signal line chart
-    fig.add_trace(
-        go.Scatter(
-            x=signals['timestamp'],
-            y=signals['signal'],
-            name='Signal',
-            line=dict(color='purple', width=2),
-            fill='tonexty'
-        ),
-        row=2, col=1
-    )
-    
-    fig.update_layout(
-        title=f"{asset_name} ({symbol}) - {strategy_type} Strategy",
-        height=700,
-        showlegend=True
-    )
-    
-    fig.update_xaxes(title_text="Date", row=2, col=1)
-    fig.update_yaxes(title_text="Price", row=1, col=1)
-    fig.update_yaxes(title_text="Signal", row=2, col=1)
-    
+    # Built once per distinct input; reruns with unchanged results reuse the cached figure
+    ma_windows = (params['short_win'], params['long_win']) if strategy_type == "Trend Following" else None
+    fig = _results_figure(signals, symbol, asset_name, strategy_type, ma_windows)
     st.plotly_chart(fig, use_container_width=True)
     
     # Trade history
-    if trades:
+    if len(trades) > 0:
         st.subheader("📋 Trade History")
         
-        trades_df = pd.DataFrame(trades)
-        trades_df['timestamp'] = pd.to_datetime(trades_df['timestamp'])
-        trades_df['price'] = trades_df['price'].round(2)
+        trades_df = _trades_dataframe(trades)
         
         # Display trade table
         st.dataframe(
@@ -638,8 +670,9 @@ def display_results(data, signals, trades, metrics, symbol, asset_name, params,
         
         with col1:
             st.write("**Trade Statistics:**")
-            buy_trades = len(trades_df[trades_df['side'] == 'buy'])
-            sell_trades = len(trades_df[trades_df['side'] == 'sell'])
+            side_counts = trades_df['side'].value_counts()
+            buy_trades = int(side_counts.get('buy', 0))
+            sell_trades = int(side_counts.get('sell', 0))
             st.write(f"- Total Trades: {len(trades_df)}")
             st.write(f"- Buy Trades: {buy_trades}")
             st.write(f"- Sell Trades: {sell_trades}")
@@ -655,6 +688,140 @@ def display_results(data, signals, trades, metrics, symbol, asset_name, params,
         st.info("ℹ️ No trades were generated with the current parameters.")
 
 
+@st.cache_data(max_entries=RESULT_CACHE_ENTRIES, show_spinner=False)
+def _results_figure(signals, symbol, asset_name, strategy_type, ma_windows=None):
+    """
+    Price, indicator and signal figure for a single-asset run, cached on its inputs.
+    ma_windows is the (short, long) pair used to label the trend following MAs.
+    """
+    import plotly.graph_objects as go
+    from plotly.subplots import make_subplots
+    
+    # Line traces use a decimated copy of long series; signal bars are never dropped
+    plot_signals = _downsample(signals, keep=signals['signal'].to_numpy() != 0)
+    # x values converted once per frame and shared by every trace
+    plot_ts = _plot_times(plot_signals)
+    signal_ts = plot_ts if plot_signals is signals else _plot_times(signals)
+    
+    fig = make_subplots(
+        rows=2, cols=1,
+        subplot_titles=(f'Price and {strategy_type} Indicators', 'Trading Signals'),
+        vertical_spacing=0.1,
+        row_heights=[0.7, 0.3]
+    )
+    
+    # Traces are collected with their subplot rows and added to the figure in one call
+    traces = []
+    rows = []
+    
+    # Price
+    traces.append(go.Scattergl(
+        x=plot_ts,
+        y=plot_signals['last_price'],
+        name='Price',
+        line=dict(color='black', width=1)
+    ))
+    rows.append(1)
+    
+    if strategy_type == "Trend Following":
+        # Moving averages
+        traces.append(go.Scattergl(
+            x=plot_ts,
+            y=plot_signals['ma_short'],
+            name=f'MA{ma_windows[0]}',
+            line=dict(color='blue', width=1)
+        ))
+        rows.append(1)
+        
+        traces.append(go.Scattergl(
+            x=plot_ts,
+            y=plot_signals['ma_long'],
+            name=f'MA{ma_windows[1]}',
+            line=dict(color='red', width=1)
+        ))
+        rows.append(1)
+    
+    else:  # Mean Reversion
+        # Bollinger Bands
+        traces.append(go.Scattergl(
+            x=plot_ts,
+            y=plot_signals['upper'],
+            name='Upper Band',
+            line=dict(color='red', width=1, dash='dash'),
+            showlegend=True
+        ))
+        rows.append(1)
+        
+        traces.append(go.Scattergl(
+            x=plot_ts,
+            y=plot_signals['lower'],
+            name='Lower Band',
+            line=dict(color='green', width=1, dash='dash'),
+            fill='tonexty',
+            fillcolor='rgba(0,100,80,0.1)',
+            showlegend=True
+        ))
+        rows.append(1)
+        
+        traces.append(go.Scattergl(
+            x=plot_ts,
+            y=plot_signals['mid'],
+            name='Middle Line',
+            line=dict(color='blue', width=1)
+        ))
+        rows.append(1)
+    
+    # Buy/Sell signals (boolean masks over NumPy arrays, no DataFrame copies)
+    signal_arr = signals['signal'].to_numpy()
+    price_arr = signals['last_price'].to_numpy()
+    buy_mask = signal_arr == 1
+    sell_mask = signal_arr == -1
+    
+    if buy_mask.any():
+        traces.append(go.Scattergl(
+            x=signal_ts[buy_mask],
+            y=price_arr[buy_mask],
+            mode='markers',
+            name='Buy Signal',
+            marker=dict(color='green', size=10, symbol='triangle-up')
+        ))
+        rows.append(1)
+    
+    if sell_mask.any():
+        traces.append(go.Scattergl(
+            x=signal_ts[sell_mask],
+            y=price_arr[sell_mask],
+            mode='markers',
+            name='Sell Signal',
+            marker=dict(color='red', size=10, symbol='triangle-down')
+        ))
+        rows.append(1)
+    
+    # Signal line chart
+    traces.append(go.Scattergl(
+        x=plot_ts,
+        y=plot_signals['signal'],
+        name='Signal',
+        line=dict(color='purple', width=2),
+        fill='tonexty'
+    ))
+    rows.append(2)
+    
+    fig.add_traces(traces, rows=rows, cols=[1] * len(traces))
+    
+    fig.update_layout(
+        title=f"{asset_name} ({symbol}) - {strategy_type} Strategy",
+        height=700,
+        showlegend=True
+    )
+    
+    fig.update_xaxes(title_text="Date", row=2, col=1)
+    fig.update_yaxes(title_text="Price", row=1, col=1)
+    fig.update_yaxes(title_text="Signal", row=2, col=1)
+    
+    return fig
+
+
 def display_arbitrage_results(data1, data2, signals, trades, metrics, symbol1, symbol2, asset_name, params):
     """Display arbitrage backtest results"""
     
@@ -708,8 +875,10 @@ def display_arbitrage_results(data1, data2, signals, trades, metrics, symbol1, s
     with col2:
         # Individual asset returns comparison
         if len(data1) > 0 and len(data2) > 0:
-            asset1_return = (data1['last_price'].iloc[-1] - data1['last_price'].iloc[0]) / data1['last_price'].iloc[0]
-            asset2_return = (data2['last_price'].iloc[-1] - data2['last_price'].iloc[0]) / data2['last_price'].iloc[0]
+            prices1 = data1['last_price'].to_numpy()
+            prices2 = data2['last_price'].to_numpy()
+            asset1_return = (prices1[-1] - prices1[0]) / prices1[0]
+            asset2_return = (prices2[-1] - prices2[0]) / prices2[0]
             equal_weight_return = (asset1_return + asset2_return) / 2
             equal_weight_final = params['starting_cash'] * (1 + equal_weight_return)
             
@@ -723,96 +892,8 @@ def display_arbitrage_results(data1, data2, signals, trades, metrics, symbol1, s
     # Price chart with spread
     st.subheader(f"📈 Asset Prices and Spread Analysis")
     
-    fig = make_subplots(
-        rows=3, cols=1,
-        subplot_titles=(f'{symbol1} vs {symbol2} Prices', 'Price Spread', 'Trading Signals'),
-        vertical_spacing=0.1,
-        row_heights=[0.4, 0.3, 0.3]
-    )
-    
-    # Normalize prices for better comparison
-    data1_norm = data1['last_price'] / data1['last_price'].iloc[0] * 100
-    data2_norm = data2['last_price'] / data2['last_price'].iloc[0] * 100
-    
-    # Asset prices (normalized)
-    fig.add_trace(
-        go.Scatter(
-            x=data1['timestamp'],
-            y=data1_norm,
-            name=f'{symbol1} (normalized)',
-            line=dict(color='blue', width=2)
-        ),
-        row=1, col=1
-    )
-    
-    fig.add_trace(
-        go.Scatter(
-            x=data2['timestamp'],
-            y=data2_norm,
-            name=f'{symbol2} (normalized)',
-            line=dict(color='red', width=2)
-        ),
-        row=1, col=1
-    )
-    
-    # Price spread
-    if 'spread' in signals.columns:
-        fig.add_trace(
-            go.Scatter(
-                x=signals['timestamp'],
-                y=signals['spread'],
-                name='Price Spread',
-                line=dict(color='purple', width=2)
-            ),
-            row=2, col=1
-        )
-        
-        # Add spread thresholds if available
-        if 'upper_threshold' in signals.columns:
-            fig.add_trace(
-                go.Scatter(
-                    x=signals['timestamp'],
-                    y=signals['upper_threshold'],
-                    name='Upper Threshold',
-                    line=dict(color='red', width=1, dash='dash')
-                ),
-                row=2, col=1
-            )
-            
-        if 'lower_threshold' in signals.columns:
-            fig.add_trace(
-                go.Scatter(
-                    x=signals['timestamp'],
-                    y=signals['lower_threshold'],
-                    name='Lower Threshold',
-                    line=dict(color='green', width=1, dash='dash')
-                ),
-                row=2, col=1
-            )
-    
-    # Trading signals
-    fig.add_trace(
-        go.Scatter(
-            x=signals['timestamp'],
-            y=signals['signal'],
-            name='Signal',
-            line=dict(color='orange', width=2),
-            fill='tonexty'
-        ),
-        row=3, col=1
-    )
-    
-    fig.update_layout(
-        title=f"{asset_name} - Cross-Asset Arbitrage Strategy",
-        height=800,
-        showlegend=True
-    )
-    
-    fig.update_xaxes(title_text="Date", row=3, col=1)
-    fig.update_yaxes(title_text="Normalized Price", row=1, col=1)
-    fig.update_yaxes(title_text="Spread", row=2, col=1)
-    fig.update_yaxes(title_text="Signal", row=3, col=1)
-    
+    # Built once per distinct input; reruns with unchanged results reuse the cached figure
+    fig = _arbitrage_figure(data1, data2, signals, symbol1, symbol2, asset_name)
     st.plotly_chart(fig, use_container_width=True)
     
     # Strategy parameters summary
@@ -834,32 +915,29 @@ def display_arbitrage_results(data1, data2, signals, trades, metrics, symbol1, s
             st.write(f"- Hedge Ratio Std Dev: {hedge_ratio_std:.2f}")
     
     # Trade history
-    if trades:
+    if len(trades) > 0:
         st.subheader("📋 Trade History")
         
-        trades_df = pd.DataFrame(trades)
-        trades_df['timestamp'] = pd.to_datetime(trades_df['timestamp'])
-        trades_df['price'] = trades_df['price'].round(2)
-        
-        # Group trades by pair
-        pair_trades = []
-        for i in range(0, len(trades_df), 2):
-            if i + 1 < len(trades_df):
-                trade1 = trades_df.iloc[i]
-                trade2 = trades_df.iloc[i + 1]
-                pair_trades.append({
-                    'timestamp': trade1['timestamp'],
-                    'asset1_side': trade1['side'],
-                    'asset1_symbol': trade1['symbol'],
-                    'asset1_price': trade1['price'],
-                    'asset2_side': trade2['side'],
-                    'asset2_symbol': trade2['symbol'],
-                    'asset2_price': trade2['price'],
-                    'signal': trade1['signal']
-                })
-        
-        if pair_trades:
-            pairs_df = pd.DataFrame(pair_trades)
+        trades_df = _trades_dataframe(trades)
+        
+        # Group trades by pair: even rows are the first leg, odd rows the second
+        first_leg = trades_df.iloc[0::2].reset_index(drop=True)
+        second_leg = trades_df.iloc[1::2].reset_index(drop=True)
+        num_pairs = min(len(first_leg), len(second_leg))
+        
+        if num_pairs > 0:
+            first_leg = first_leg.iloc[:num_pairs]
+            second_leg = second_leg.iloc[:num_pairs]
+            pairs_df = pd.DataFrame({
+                'timestamp': first_leg['timestamp'],
+                'asset1_side': first_leg['side'],
+                'asset1_symbol': first_leg['symbol'],
+                'asset1_price': first_leg['price'],
+                'asset2_side': second_leg['side'],
+                'asset2_symbol': second_leg['symbol'],
+                'asset2_price': second_leg['price'],
+                'signal': first_leg['signal']
+            })
             st.write("**Pair Trades:**")
             st.dataframe(
                 pairs_df[['timestamp', 'asset1_side', 'asset1_symbol', 'asset1_price', 
@@ -872,8 +950,9 @@ def display_arbitrage_results(data1, data2, signals, trades, metrics, symbol1, s
         
         with col1:
             st.write("**Trade Statistics:**")
-            asset1_trades = len(trades_df[trades_df['symbol'] == symbol1])
-            asset2_trades = len(trades_df[trades_df['symbol'] == symbol2])
+            symbol_counts = trades_df['symbol'].value_counts()
+            asset1_trades = int(symbol_counts.get(symbol1, 0))
+            asset2_trades = int(symbol_counts.get(symbol2, 0))
             st.write(f"- Total Individual Trades: {len(trades_df)}")
             st.write(f"- {symbol1} Trades: {asset1_trades}")
             st.write(f"- {symbol2} Trades: {asset2_trades}")
@@ -890,5 +969,109 @@ def display_arbitrage_results(data1, data2, signals, trades, metrics, symbol1, s
         st.info("ℹ️ No trades were generated with the current parameters. Try adjusting the threshold or lookback window.")
 
 
+@st.cache_data(max_entries=RESULT_CACHE_ENTRIES, show_spinner=False)
+def _arbitrage_figure(data1, data2, signals, symbol1, symbol2, asset_name):
+    """Prices, spread and signal figure for an arbitrage run, cached on its inputs"""
+    import plotly.graph_objects as go
+    from plotly.subplots import make_subplots
+    
+    fig = make_subplots(
+        rows=3, cols=1,
+        subplot_titles=(f'{symbol1} vs {symbol2} Prices', 'Price Spread', 'Trading Signals'),
+        vertical_spacing=0.1,
+        row_heights=[0.4, 0.3, 0.3]
+    )
+    
+    # Line traces use decimated copies of long series; signal bars are never dropped
+    plot_data1 = _downsample(data1)
+    plot_data2 = _downsample(data2)
+    plot_signals = _downsample(signals, keep=signals['signal'].to_numpy() != 0)
+    # x values converted once per frame and shared by every trace
+    plot_ts1 = _plot_times(plot_data1)
+    plot_ts2 = _plot_times(plot_data2)
+    plot_ts = _plot_times(plot_signals)
+    
+    # Normalize prices for better comparison (one scalar divide, vectorized multiply)
+    prices1 = plot_data1['last_price'].to_numpy()
+    prices2 = plot_data2['last_price'].to_numpy()
+    data1_norm = prices1 * (100.0 / prices1[0])
+    data2_norm = prices2 * (100.0 / prices2[0])
+    
+    # Traces are collected with their subplot rows and added to the figure in one call
+    traces = []
+    rows = []
+    
+    # Asset prices (normalized)
+    traces.append(go.Scattergl(
+        x=plot_ts1,
+        y=data1_norm,
+        name=f'{symbol1} (normalized)',
+        line=dict(color='blue', width=2)
+    ))
+    rows.append(1)
+    
+    traces.append(go.Scattergl(
+        x=plot_ts2,
+        y=data2_norm,
+        name=f'{symbol2} (normalized)',
+        line=dict(color='red', width=2)
+    ))
+    rows.append(1)
+    
+    # Price spread
+    if 'spread' in signals.columns:
+        traces.append(go.Scattergl(
+            x=plot_ts,
+            y=plot_signals['spread'],
+            name='Price Spread',
+            line=dict(color='purple', width=2)
+        ))
+        rows.append(2)
+        
+        # Add spread thresholds if available
+        if 'upper_threshold' in signals.columns:
+            traces.append(go.Scattergl(
+                x=plot_ts,
+                y=plot_signals['upper_threshold'],
+                name='Upper Threshold',
+                line=dict(color='red', width=1, dash='dash')
+            ))
+            rows.append(2)
+            
+        if 'lower_threshold' in signals.columns:
+            traces.append(go.Scattergl(
+                x=plot_ts,
+                y=plot_signals['lower_threshold'],
+                name='Lower Threshold',
+                line=dict(color='green', width=1, dash='dash')
+            ))
+            rows.append(2)
+    
+    # Trading signals
+    traces.append(go.Scattergl(
+        x=plot_ts,
+        y=plot_signals['signal'],
+        name='Signal',
+        line=dict(color='orange', width=2),
+        fill='tonexty'
+    ))
+    rows.append(3)
+    
+    fig.add_traces(traces, rows=rows, cols=[1] * len(traces))
+    
+    fig.update_layout(
+        title=f"{asset_name} - Cross-Asset Arbitrage Strategy",
+        height=800,
+        showlegend=True
+    )
+    
+    fig.update_xaxes(title_text="Date", row=3, col=1)
+    fig.update_yaxes(title_text="Normalized Price", row=1, col=1)
+    fig.update_yaxes(title_text="Spread", row=2, col=1)
+    fig.update_yaxes(title_text="Signal", row=3, col=1)
+    
+    return fig
+
+
 if __name__ == "__main__":
     main()
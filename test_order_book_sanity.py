@@ -0,0 +1,84 @@
+import pytest
+
+from oms import OrderManagementSystem
+from order import Order
+from order_book import LimitOrderBook
+
+
+def make_order(order_id, side, quantity, order_type="limit", price=None, symbol="EURUSD=X"):
+    return Order(id=order_id, symbol=symbol, side=side, quantity=quantity, type=order_type, price=price)
+
+
+def test_buy_limit_does_not_trade_above_its_limit():
+    book = LimitOrderBook("EURUSD=X")
+    book.add_order(make_order("ask", "sell", 100, price=1.0845))
+
+    reports = book.add_order(make_order("buy", "buy", 100, price=1.084))
+
+    assert reports == []
+    assert book.best_bid() == 1.084
+    assert book.best_ask() == 1.0845
+
+
+def test_sell_limit_does_not_trade_below_its_limit():
+    book = LimitOrderBook("EURUSD=X")
+    book.add_order(make_order("bid", "buy", 100, price=1.0841))
+
+    reports = book.add_order(make_order("sell", "sell", 100, price=1.0844))
+
+    assert reports == []
+    assert book.best_bid() == 1.0841
+    assert book.best_ask() == 1.0844
+
+
+def test_market_sell_hits_highest_bid_first():
+    book = LimitOrderBook("EURUSD=X")
+    book.add_order(make_order("low", "buy", 100, price=1.0841))
+    book.add_order(make_order("high", "buy", 100, price=1.0844))
+
+    reports = book.add_order(make_order("mkt", "sell", 100, order_type="market"))
+
+    assert reports[0].price == 1.0844
+    assert reports[1].order_id == "high"
+    assert book.best_bid() == 1.0841
+
+
+def test_tick_size_rejects_off_grid_prices():
+    book = LimitOrderBook("EURUSD=X", tick_size=0.01)
+
+    with pytest.raises(ValueError):
+        book.add_order(make_order("buy", "buy", 100, price=1.084))
+
+    assert book.best_bid() is None
+
+
+def test_tick_size_matches_on_grid_prices():
+    book = LimitOrderBook("AAPL", tick_size=0.01)
+    book.add_order(make_order("ask", "sell", 100, price=190.25, symbol="AAPL"))
+
+    reports = book.add_order(make_order("buy", "buy", 40, price=190.25, symbol="AAPL"))
+
+    assert [r.filled_qty for r in reports] == [40, 40]
+    assert reports[0].status == "filled"
+    assert book.best_ask_qty() == 60
+
+
+def test_order_for_another_symbol_is_rejected():
+    book = LimitOrderBook("AAPL")
+
+    with pytest.raises(ValueError):
+        book.add_order(make_order("buy", "buy", 100, price=190.25, symbol="MSFT"))
+
+    assert book.best_bid() is None
+
+
+def test_oms_rejects_order_for_another_book_before_accepting_it():
+    book = LimitOrderBook("AAPL")
+    oms = OrderManagementSystem(matching_engine=book)
+
+    with pytest.raises(ValueError):
+        oms.new_order(make_order("1", "buy", 100, price=190.25, symbol="MSFT"))
+
+    assert oms._statuses == {}
+    assert oms._orders == {}
+    assert book.best_bid() is None